@@ -21,6 +21,10 @@
 """
 
 import math  # noqa
+import operator
+import os
+import sys
+from functools import cached_property, lru_cache
 import numpy as np
 import re
 import ply.yacc as yacc
@@ -85,11 +89,16 @@ class InvalidParameterNumber(Exception):
         )
 
 
+@lru_cache(maxsize=4096)
 def gen_U(theta, phi, lamda):
     """
     Generates the U / U3 gate matrix. The definition of this gate is based on:
     https://qiskit.org/documentation/stubs/qiskit.circuit.library.U3Gate.html (Sept 08, 2022)
 
+    Circuits typically reuse a handful of angles, so the matrices are
+    memoized. The returned arrays are read-only since they are shared
+    between calls.
+
     Args:
         theta:
         phi:
@@ -102,7 +111,9 @@ def gen_U(theta, phi, lamda):
     m12 = -np.exp(1j * lamda) * np.sin(theta / 2)
     m21 = np.exp(1j * phi) * np.sin(theta / 2)
     m22 = np.exp(1j * (phi + lamda)) * np.cos(theta / 2)
-    return np.array([[m11, m12], [m21, m22]], dtype=np.complex128)
+    matrix = np.array([[m11, m12], [m21, m22]], dtype=np.complex128)
+    matrix.flags.writeable = False
+    return matrix
 
 
 def gen_dummy():
@@ -141,66 +152,45 @@ def extract_inc(filename):
             return ret[0]
 
 
+# Binary operators understood by eval_exp, mapped to their evaluation
+_EVAL_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
 def eval_exp(rout_params, instr_params, actual_params):
     params_index = []
     eval_params = []
     eval_param_op = []
-    # print("Params we got ")
-    # print(rout_params)
-    # print(instr_params)
-    # print(actual_params)
     for param in instr_params:
-        rout_index = 0
         if isinstance(param, str):
-            if param == "+" or param == "-" or param == "*" or param == "/":
+            if param in _EVAL_OPS:
                 eval_param_op.append(param)
             else:
-                for k in rout_params:
+                for rout_index, k in enumerate(rout_params):
                     if param == k:
                         # matches each local parameter inside the routine to
                         # the parameter value used in the main function
-                        # print("appending str")
-                        # print(actual_params[rout_index])
-                        # print("pre str eval params")
-                        # print(eval_params)
+                        value = actual_params[rout_index]
                         if len(eval_param_op) == 0:
-                            eval_param_op.append(actual_params[rout_index])
-
-                        elif (
-                            eval_param_op[len(eval_param_op) - 1] == "+"
-                            or eval_param_op[len(eval_param_op) - 1] == "-"
-                            or eval_param_op[len(eval_param_op) - 1] == "*"
-                            or eval_param_op[len(eval_param_op) - 1] == "/"
-                        ):
-
-                            eval_param_op.append(actual_params[rout_index])
+                            eval_param_op.append(value)
+                        elif isinstance(eval_param_op[-1], str) and eval_param_op[-1] in _EVAL_OPS:
+                            eval_param_op.append(value)
                             eval_params.append(eval_param_op)
                             eval_param_op = []
                         else:
                             eval_params.append(eval_param_op)
-                            eval_param_op = []
-                            eval_param_op.append(actual_params[rout_index])
+                            eval_param_op = [value]
                         break
-                    rout_index += 1
         elif isinstance(param, list):  # non evaluated expression
             p = eval_exp(rout_params, param, actual_params)
-            # print("recursie params")
-            # print(p)
-            # print("pre list eval params")
-            # print(eval_params)
-            # if len(params_index) == 1:
-            # print("found")
-            # print(p)
             if len(eval_param_op) == 0:
                 if len(p) > 0:
                     eval_param_op.append(p[0])
-
-            elif (
-                eval_param_op[len(eval_param_op) - 1] == "+"
-                or eval_param_op[len(eval_param_op) - 1] == "-"
-                or eval_param_op[len(eval_param_op) - 1] == "*"
-                or eval_param_op[len(eval_param_op) - 1] == "/"
-            ):
+            elif isinstance(eval_param_op[-1], str) and eval_param_op[-1] in _EVAL_OPS:
                 eval_param_op.append(p[0])
                 eval_params.append(eval_param_op)
                 eval_param_op = []
@@ -209,46 +199,25 @@ def eval_exp(rout_params, instr_params, actual_params):
                 eval_param_op = []
                 if len(p) > 0:
                     eval_param_op.append(p[0])
-            # print("post list eval params")
-            # print(eval_params)
         else:
             if len(eval_param_op) == 0:
                 eval_param_op.append(param)
-
-            elif (
-                eval_param_op[len(eval_param_op) - 1] == "+"
-                or eval_param_op[len(eval_param_op) - 1] == "-"
-                or eval_param_op[len(eval_param_op) - 1] == "*"
-                or eval_param_op[len(eval_param_op) - 1] == "/"
-            ):
+            elif isinstance(eval_param_op[-1], str) and eval_param_op[-1] in _EVAL_OPS:
                 eval_param_op.append(param)
                 eval_params.append(eval_param_op)
                 eval_param_op = []
             else:
                 eval_params.append(eval_param_op)
-                eval_param_op = []
-                eval_param_op.append(param)
+                eval_param_op = [param]
     if len(eval_param_op) > 0:
         eval_params.append(eval_param_op)
-    # print("eval params")
-    # print(eval_params)
-    if True:
-        # print("evals")
-        # print(eval_params)
-        for ev in eval_params:
-            if len(ev) < 2:
-                params_index.append(ev[0])
-                continue
-            if ev[1] == "-":
-                params_index.append(ev[0] - ev[2])
-            if ev[1] == "+":
-                params_index.append(ev[0] + ev[2])
-            if ev[1] == "*":
-                params_index.append(ev[0] * ev[2])
-            if ev[1] == "/":
-                params_index.append(ev[0] / ev[2])
-    # print("here is ")
-    # print(params_index)
+    for ev in eval_params:
+        if len(ev) < 2:
+            params_index.append(ev[0])
+            continue
+        operation = _EVAL_OPS.get(ev[1]) if isinstance(ev[1], str) else None
+        if operation is not None:
+            params_index.append(operation(ev[0], ev[2]))
     return params_index
 
 
@@ -331,6 +300,7 @@ class OqasmParser(object):
         self.start = "main"
         self.format_version = False
         self.lineno = 0
+        self.include_matrices = include_matrices
         self.compiler = ASTCircuitBuilder(include_matrices=include_matrices)
         U = AbstractGate("U", [float, float, float], arity=1, matrix_generator=gen_U)
         u1 = AbstractGate("U1", [float], arity=1, matrix_generator=gen_u1)
@@ -413,6 +383,32 @@ class OqasmParser(object):
                 self.standard_gates[gate_name] = gate_definition.name
                 self.compiler.gate_set.add_signature(gate_definition)
 
+    def reset(self):
+        """
+        Resets the per-parse compiler state (registers, routines, parsed
+        operations), so that a built parser can be reused on another piece
+        of source code without rebuilding the PLY tables.
+        """
+        gate_set = self.compiler.gate_set
+        self.compiler = ASTCircuitBuilder(include_matrices=self.include_matrices)
+        self.compiler.gate_set = gate_set
+        self.format_version = False
+        self.lineno = 0
+        self.input = ""
+        self.routines = []
+        self.nbcbits = 0
+        self.nbqbits = 0
+        self.cregs = []
+        self.qregs = []
+
+    @cached_property
+    def reverse_standard_gates(self):
+        """
+        Inverse of standard_gates, mapping myQLM gate names back to their
+        OpenQASM identifiers. Computed once per parser.
+        """
+        return {v: k for k, v in self.standard_gates.items()}
+
     def add_creg(self, elem):
         self.cregs.append(elem)
         self.nbcbits += elem.index
@@ -1591,6 +1587,11 @@ class OqasmParser(object):
     def build(self, write_tables=False, debug=False, tabmodule="oqasm_tab", **kwargs):
         """Takes care of building a parser
 
+        When the environment variable QAT_QASM_PLY_CACHE is set (and debug
+        is off), the generated LALR tables are written once to an on-disk
+        cache next to this module and reloaded on subsequent builds, so
+        building the parser again reduces to importing the cached tables.
+
         Args:
             debug: whether to activate debug output or not
             write_tables: generate parser table file or not
@@ -1598,6 +1599,14 @@ class OqasmParser(object):
         Returns:
             Nothing
         """
+        if os.environ.get("QAT_QASM_PLY_CACHE") and not debug:
+            outputdir = os.path.join(os.path.dirname(__file__), "_ply_cache")
+            os.makedirs(outputdir, exist_ok=True)
+            if outputdir not in sys.path:
+                sys.path.insert(0, outputdir)
+            kwargs.setdefault("optimize", 1)
+            kwargs.setdefault("outputdir", outputdir)
+            write_tables = True
         self.parser = yacc.yacc(
             module=self,
             write_tables=write_tables,
@@ -45,12 +45,36 @@ to the port 15011. The following code defines a myQLM QPU wrapping the PyQuil QV
     result = qpu.submit(qlm_job)
 """
 
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
 
 from qat.interop.pyquil.converters import qlm_to_pyquil
+from qat.comm.shared.ttypes import Job
+from qat.core import Batch
 from qat.core.qpu.qpu import QPUHandler
-from qat.core.wrappers.result import Result as QlmRes, Sample
+from qat.core.wrappers.result import Result as QlmRes, BatchResult, Sample
+
+# Maximal number of worker threads used to overlap job submissions
+_MAX_SUBMIT_WORKERS = 32
+
+
+@lru_cache(maxsize=64)
+def _bit_weights(nbqbits):
+    """
+    Returns the vector of bit weights (1 << i) used to pack per-qubit
+    measurements into integer states. The vector is constant per qubit
+    count, so it is cached and returned read-only.
+
+    Args:
+        nbqbits: Number of qubits of the measured register
+
+    Returns:
+        A read-only numpy array of shift weights
+    """
+    weights = 1 << np.arange(nbqbits, dtype=np.int64)
+    weights.flags.writeable = False
+    return weights
 
 
 def generate_qlm_result(pyquil_result):
@@ -73,20 +97,24 @@ def generate_qlm_result(pyquil_result):
     # FIXME should work with native pyquil results also
     for register_result in pyquil_result.readout_data.values():
         nbshots = len(register_result)
-        measurements = [
-            sum([b << i for i, b in enumerate(entry)]) for entry in register_result
-        ]
+        if nbshots == 0:
+            qlm_result = QlmRes()
+            qlm_result.raw_data = []
+            continue
+        measurements = np.asarray(register_result, dtype=np.int64)
+        weights = _bit_weights(measurements.shape[1])
+        states, freqs = np.unique(measurements.dot(weights), return_counts=True)
+        probs = freqs / nbshots
+        if nbshots > 1:
+            # FIXME check that err is correct
+            errs = np.sqrt(probs * (1. - probs) / (nbshots - 1)).tolist()
+        else:
+            errs = [None] * len(probs)
 
-        counts = Counter(measurements)
         qlm_result = QlmRes()
-        # FIXME check that err is correct
         qlm_result.raw_data = [
-            Sample(state=state,
-                   probability=freq / nbshots,
-                   err=np.sqrt(freq / nbshots * (1. - freq / nbshots) / (nbshots - 1))
-                   if nbshots > 1 else None
-                   )
-            for state, freq in counts.items()
+            Sample(state=int(state), probability=float(prob), err=err)
+            for state, prob, err in zip(states, probs, errs)
         ]
     return qlm_result
 
@@ -119,6 +147,30 @@ class PyquilQPU(QPUHandler):
         """
         self.qpu = qpu
 
+    def _submit_batch(self, qlm_batch):
+        """
+        Submits a Batch object to execute on the pyquil QPU.
+
+        Job executions are I/O bound (RPC to the QVM or to the quantum
+        chip), so the jobs are submitted concurrently through a thread
+        pool and the network latencies overlap. Results are returned in
+        the order of the jobs in the batch.
+
+        Args:
+            qlm_batch: :class:`~qat.core.Batch` or :class:`~qat.core.Job`
+                    object. If a QLM Job object is given, it will be
+                    converted in a QLM Batch object
+
+        Returns:
+            A QLM BatchResult object
+        """
+        if isinstance(qlm_batch, Job):
+            qlm_batch = Batch(jobs=[qlm_batch])
+        max_workers = min(_MAX_SUBMIT_WORKERS, len(qlm_batch.jobs)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.submit_job, qlm_batch.jobs))
+        return BatchResult(results=results, meta_data=qlm_batch.meta_data)
+
     def submit_job(self, qlm_job):
         """
         Execute a myQLM jobs
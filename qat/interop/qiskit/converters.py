@@ -42,6 +42,7 @@ Or
 
 import warnings
 import operator
+from functools import lru_cache
 import numpy as np
 from symengine import Add, Mul, Pow
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
@@ -58,46 +59,40 @@ from qat.comm.datamodel.ttypes import OpType
 from qat.comm.shared.ttypes import ProcessingType
 
 
-def _get_qindex(circ, name, index):
+@lru_cache(maxsize=128)
+def _layout_offsets(layout):
     """
-    Find the qubit index.
+    Computes the absolute offset of each register of a layout, i.e. the
+    index of its first bit if all registers are concatenated.
 
     Args:
-        circ: The Qiskit QuantumCircuit in question
-        name: The name of the quantum register
-        index: The qubit's relative index inside the register
+        layout: Tuple of (name, size) pairs describing the registers
 
     Returns:
-        The qubit's absolute index if all registers are concatenated.
+        Dictionary mapping each register name to its absolute offset.
     """
-    ret = 0
-    for reg in circ.qregs:
-        if name != reg.name:
-            ret += reg.size
-        else:
-            return ret + index
-    return ret + index
+    offsets = {}
+    offset = 0
+    for name, size in layout:
+        offsets[name] = offset
+        offset += size
+    return offsets
 
 
-def _get_cindex(circ, name, index):
+def _register_offsets(registers):
     """
-    Find the classical bit index.
+    Precompute the absolute offset of each register. The offset tables
+    are cached by register layout, so the circuits of a batch sharing
+    their register structure (e.g. experiments of the same ansatz with
+    different bound parameters) only compute them once.
 
     Args:
-        circ: The Qiskit QuantumCircuit in question
-        name: The name of the classical register
-        index: The qubit's relative index inside the register
+        registers: List of Qiskit QuantumRegister or ClassicalRegister objects
 
     Returns:
-        The classical bit's absolute index if all registers are concatenated.
+        Dictionary mapping each register name to its absolute offset.
     """
-    ret = 0
-    for reg in circ.cregs:
-        if name != reg.name:
-            ret += reg.size
-        else:
-            return ret + index
-    return ret + index
+    return _layout_offsets(tuple((reg.name, reg.size) for reg in registers))
 
 
 def _sympy_arg_to_arith_expr(prog, variables, param, arg):
@@ -174,11 +169,16 @@ def _qiskit_to_qlm_param(prog, variables, param):
     return var
 
 
+@lru_cache(maxsize=4096)
 def _gen_u(theta, phi, lamda):
     """
     Generates the U / U3 gate matrix. The definition of this gate is based on:
     https://qiskit.org/documentation/stubs/qiskit.circuit.library.U3Gate.html (Sept 08, 2022)
 
+    Circuits typically reuse a handful of angles, so the matrices are
+    memoized. The returned arrays are read-only since they are shared
+    between calls.
+
     Args:
         theta:
         phi:
@@ -191,7 +191,9 @@ def _gen_u(theta, phi, lamda):
     m12 = -np.exp(1j * lamda) * np.sin(theta / 2)
     m21 = np.exp(1j * phi) * np.sin(theta / 2)
     m22 = np.exp(1j * (phi + lamda)) * np.cos(theta / 2)
-    return np.array([[m11, m12], [m21, m22]], dtype=np.complex128)
+    matrix = np.array([[m11, m12], [m21, m22]], dtype=np.complex128)
+    matrix.flags.writeable = False
+    return matrix
 
 
 def _gen_u2(phi, lmbda):
@@ -227,9 +229,11 @@ def _gen_rxx(theta):
                      [-1j * np.sin(theta / 2), 0, 0, np.cos(theta / 2)]])
 
 
+@lru_cache(maxsize=4096)
 def _gen_rzz(theta):
     """
-    Generates the RZZ gate matrix.
+    Generates the RZZ gate matrix. The matrices are memoized and returned
+    as read-only arrays, as for the U gate matrices.
 
     Args:
         theta:
@@ -237,7 +241,9 @@ def _gen_rzz(theta):
     Returns:
         numpy.ndarray RZZ gate matrix
     """
-    return np.diag([1, np.exp(1j * theta), np.exp(1j * theta), 1])
+    matrix = np.diag([1, np.exp(1j * theta), np.exp(1j * theta), 1])
+    matrix.flags.writeable = False
+    return matrix
 
 
 def _gen_r(theta, phi):
@@ -315,6 +321,23 @@ GATE_DIC = {
     "u3": U3,
 }
 
+# Controlled versions of the parameterless gates are precomputed once, so
+# the frequent controlled gates resolve with a single dict lookup instead
+# of rebuilding a .ctrl() wrapper on every application
+GATE_DIC.update({
+    "cx": X.ctrl(),
+    "cy": Y.ctrl(),
+    "cz": Z.ctrl(),
+    "ch": H.ctrl(),
+    "ccx": X.ctrl().ctrl(),
+    "cswap": SWAP.ctrl(),
+})
+
+
+# Lazily resolved controlled gates that are not precomputed in GATE_DIC
+# (e.g. multi-controlled parameterless gates)
+_CTRL_CACHE = {}
+
 
 def get_gate(gate, params, num_ctrl_qubits=None):
     """
@@ -325,20 +348,35 @@ def get_gate(gate, params, num_ctrl_qubits=None):
         num_ctrl_qubits: Number of control qbits
         params: Parameters of the Qiskit gate
     """
-    if gate[0] == "c":
-        return get_gate(gate[1:], params, num_ctrl_qubits).ctrl()
     if gate == "toffoli":
-        return get_gate("ccx", params, num_ctrl_qubits)
-    if gate[0:2] == "mc":
-        name = gate[2:]
-        for _ in range(num_ctrl_qubits):
-            name = "c" + name
-        return get_gate(name, params, num_ctrl_qubits)
-
-    gate_obj = GATE_DIC[gate]
+        gate = "ccx"
+    elif gate[0:2] == "mc":
+        gate = "c" * num_ctrl_qubits + gate[2:]
+
+    gate_obj = GATE_DIC.get(gate)
+    if gate_obj is None:
+        gate_obj = _CTRL_CACHE.get(gate)
+        if gate_obj is not None:
+            return gate_obj
+        # Count the control prefix in a single pass and look up the
+        # base gate directly, instead of recursing once per control
+        nbctrls = 0
+        while nbctrls < len(gate) and gate[nbctrls] == "c":
+            nbctrls += 1
+        base = GATE_DIC[gate[nbctrls:]]
+        if isinstance(base, AbstractGate) or len(params) > 0:
+            gate_obj = base(*params)
+            for _ in range(nbctrls):
+                gate_obj = gate_obj.ctrl()
+            return gate_obj
+        for _ in range(nbctrls):
+            base = base.ctrl()
+        _CTRL_CACHE[gate] = base
+        return base
+
     if isinstance(gate_obj, AbstractGate) or len(params) > 0:
-        return GATE_DIC[gate](*params)
-    return GATE_DIC[gate]
+        return gate_obj(*params)
+    return gate_obj
 
 
 def qiskit_to_qlm(qiskit_circuit, sep_measures=False, **kwargs):
@@ -372,62 +410,58 @@ def qiskit_to_qlm(qiskit_circuit, sep_measures=False, **kwargs):
          - :code:`False`: the result is a :class:`~qat.core.Circuit`
     """
     prog = Program()
-    qbits_num = 0
     to_measure = []
-    for reg in qiskit_circuit.qregs:
-        qbits_num = qbits_num + reg.size
+    qbit_offsets = _register_offsets(qiskit_circuit.qregs)
+    qbits_num = sum(reg.size for reg in qiskit_circuit.qregs)
     qbits = prog.qalloc(qbits_num)
 
-    cbits_num = 0
-    for reg in qiskit_circuit.cregs:
-        cbits_num = cbits_num + reg.size
+    cbit_offsets = _register_offsets(qiskit_circuit.cregs)
+    cbits_num = sum(reg.size for reg in qiskit_circuit.cregs)
     cbits = prog.calloc(cbits_num)
     variables = []
+    # Bind the loop invariants to locals: the loop body runs once per
+    # gate of the translated circuit
+    prog_measure = prog.measure
+    prog_reset = prog.reset
+    prog_apply = prog.apply
     for gate_op in qiskit_circuit.data:
-        if gate_op[0].name in ("barrier", "opaque"):
+        instruction = gate_op[0]
+        op_name = instruction.name
+        if op_name in ("barrier", "opaque"):
             continue
-        qbit_args = []
-        cbit_args = []
-        prms = []  # gate parameters
-        
-        # Get qbit arguments
-        for qarg in gate_op[1]:
-            qbit_args.append(
-                _get_qindex(qiskit_circuit, qarg._register.name, qarg._index))
-
-        # Get cbit arguments
-        for carg in gate_op[2]:
-            cbit_args.append(
-                _get_cindex(qiskit_circuit, carg._register.name, carg._index))
-
-        # Get parameters
-        for param in gate_op[0].params:
-            if isinstance(param, (Parameter, ParameterExpression)):
-                prms.append(_qiskit_to_qlm_param(prog, variables, param))
-            else:
-                prms.append(float(param))
+        # Get qbit and cbit arguments
+        qbit_args = [qbit_offsets[qarg._register.name] + qarg._index
+                     for qarg in gate_op[1]]
+        cbit_args = [cbit_offsets[carg._register.name] + carg._index
+                     for carg in gate_op[2]]
+
+        # Get gate parameters
+        prms = [_qiskit_to_qlm_param(prog, variables, param)
+                if isinstance(param, (Parameter, ParameterExpression))
+                else float(param)
+                for param in instruction.params]
         # Apply measure #
-        if gate_op[0].name == "measure":
+        if op_name == "measure":
             if sep_measures:
                 to_measure.extend(qbit_args)
             else:
-                prog.measure([qbits[i] for i in qbit_args],
+                prog_measure([qbits[i] for i in qbit_args],
                              [cbits[i] for i in cbit_args])
-        elif gate_op[0].name == "reset":
-            prog.reset([qbits[i] for i in qbit_args],
+        elif op_name == "reset":
+            prog_reset([qbits[i] for i in qbit_args],
                        [cbits[i] for i in cbit_args])
         else:
-            if gate_op[0].name == "ms":
+            if op_name == "ms":
                 # In this case, the process function needs the number of qubits
                 prms.append(len(qbit_args))
             # Apply gates #
             num_ctrl_qubits = None
             try:
-                num_ctrl_qubits = gate_op[0].num_ctrl_qubits
+                num_ctrl_qubits = instruction.num_ctrl_qubits
             except AttributeError:
                 pass
-            gate = get_gate(gate_op[0].name, prms, num_ctrl_qubits)
-            prog.apply(gate, *[qbits[i] for i in qbit_args][:gate.arity])
+            gate = get_gate(op_name, prms, num_ctrl_qubits)
+            prog_apply(gate, *[qbits[i] for i in qbit_args][:gate.arity])
     if sep_measures:
         return prog.to_circ(**kwargs), list(set(to_measure))
 
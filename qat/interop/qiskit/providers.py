@@ -85,7 +85,8 @@ three main classes:
 """
 
 import os
-from collections import Counter
+import copy
+from collections import Counter, OrderedDict
 import warnings
 from uuid import uuid4
 import numpy as np
@@ -122,9 +123,38 @@ def to_string(state, nbqbits):
     Returns:
         String of the quantum state in binary form
     """
-    state_str = bin(state)[2:]
-    state_str = "0" * (nbqbits - len(state_str)) + state_str
-    return state_str
+    return format(state, f"0{nbqbits}b")
+
+
+def _count_to_raw_data(count, nbshots):
+    """
+    Converts a Qiskit counts dictionary into a list of QLM Samples.
+    Probabilities and sampling errors are computed in a single
+    vectorized pass.
+
+    Args:
+        count: Dictionary mapping states (hex strings or ints) to their
+                number of occurrences
+        nbshots: Total number of shots
+
+    Returns:
+        List of QLM Sample objects
+    """
+    items = list(count.items())
+    states = np.fromiter(
+        (int(k, 16) if isinstance(k, str) else k for k, _ in items),
+        dtype=np.int64, count=len(items))
+    freqs = np.fromiter((v for _, v in items), dtype=np.int64,
+                        count=len(items))
+    probs = freqs / nbshots
+    if nbshots > 1:
+        errs = np.sqrt(probs * (1. - probs) / (nbshots - 1)).tolist()
+    else:
+        errs = [None] * len(items)
+    return [
+        Sample(state=int(state), probability=float(prob), err=err)
+        for state, prob, err in zip(states, probs, errs)
+    ]
 
 
 def generate_qlm_result(qiskit_result):
@@ -138,25 +168,14 @@ def generate_qlm_result(qiskit_result):
         A QLM Result object built from the data in qiskit_result
     """
 
-    nbshots = qiskit_result.results[0].shots
+    first_result = qiskit_result.results[0]
+    nbshots = first_result.shots
     try:
-        counts = [result.data.counts for result in qiskit_result.results]
+        counts = first_result.data.counts
     except AttributeError:
         print("No measures, so the result is empty")
         return QlmRes(raw_data=[])
-    counts = [{int(k, 16): v for k, v in count.items()} for count in counts]
-    ret = QlmRes(raw_data=[])
-    for state, freq in counts[0].items():
-        if not isinstance(state, int):
-            print(f"State is {type(state)}")
-        ret.raw_data.append(
-            Sample(state=state,
-                   probability=freq / nbshots,
-                   err=np.sqrt(
-                       freq / nbshots * (1. - freq / nbshots) / (nbshots - 1))
-                   if nbshots > 1 else None)
-        )
-    return ret
+    return QlmRes(raw_data=_count_to_raw_data(counts, nbshots))
 
 
 def generate_qlm_list_results(qiskit_result):
@@ -176,40 +195,38 @@ def generate_qlm_list_results(qiskit_result):
     except AttributeError:
         print("No measures, so the result is empty")
         return QlmRes(raw_data=[])
-    counts = [{int(k, 16): v for k, v in count.items()} for count in counts]
-    ret_list = []
-    for count in counts:
-        ret = QlmRes(raw_data=[])
-        for state, freq in count.items():
-            if not isinstance(state, int):
-                print("State is {type(state)}")
-            ret.raw_data.append(
-                Sample(state=state,
-                       probability=freq / nbshots,
-                       err=np.sqrt(
-                           freq / nbshots * (1. - freq / nbshots) / (nbshots - 1))
-                       if nbshots > 1 else None)
-            )
-        ret_list.append(ret)
-    return ret_list
-
-
-def _generate_experiment_result(qlm_result, metadata):
+    return [QlmRes(raw_data=_count_to_raw_data(count, nbshots))
+            for count in counts]
+
+
+def _generate_experiment_result(qlm_result, metadata, nbshots=0):
     """
     Generates a Qiskit experiment result.
 
     Args:
-        qlm_result: qat.core.wrappers.Result object which data is aggregated
+        qlm_result: qat.core.wrappers.Result object
         metadata: metadata of the circuit of the experiment
+        nbshots: number of shots of the experiment - only used when the
+                samples are aggregated. If 0, the number of samples is
+                used instead
 
     Returns:
         An ExperimentResult structure.
     """
-    samples = [hex(s.state.state) for s in qlm_result.raw_data]
-    counts = dict(Counter(samples))
+    raw_data = qlm_result.raw_data
+    if raw_data and raw_data[0].probability is not None:
+        # Aggregated samples: each state appears once, recover the
+        # multiplicities from the probabilities
+        nbshots = nbshots or len(raw_data)
+        counts = {hex(s.state.state): int(round(s.probability * nbshots))
+                  for s in raw_data}
+    else:
+        # One sample per shot: count the state occurrences
+        nbshots = len(raw_data)
+        counts = dict(Counter(hex(s.state.state) for s in raw_data))
     data = ExperimentResultData.from_dict({"counts": counts})
     return ExperimentResult(
-        shots=len(qlm_result.raw_data),
+        shots=nbshots,
         success=True,
         data=data,
         header=QobjExperimentHeader(**metadata),
@@ -224,7 +241,8 @@ def _qlm_to_qiskit_result(
         success,
         qlm_results,
         metadata,
-        qobj_header):
+        qobj_header,
+        nbshots=0):
     """
     Tranform a QLM result into a Qiskit result structure.
 
@@ -237,6 +255,7 @@ def _qlm_to_qiskit_result(
         qlm_results: List of qat.core.wrappers.Result objects
         metadata: List of the circuit's metadata
         qobj_header: user input that will be in the Result
+        nbshots: number of shots of the experiments
 
     Returns:
         A qiskit Result structure.
@@ -248,7 +267,7 @@ def _qlm_to_qiskit_result(
         job_id=job_id,
         success=success,
         results=[
-            _generate_experiment_result(result, md)
+            _generate_experiment_result(result, md, nbshots)
             for result, md in zip(qlm_results, metadata)
         ],
         header=qobj_header,
@@ -265,7 +284,8 @@ class QLMJob(JobV1):
         self._results = None
         super().__init__(*args, **kwargs)
 
-    def set_results(self, qlm_result, qobj_id, metadata, qobj_header):
+    def set_results(self, qlm_result, qobj_id, metadata, qobj_header,
+                    nbshots=0):
         """
         Sets the results of the Job.
 
@@ -274,6 +294,7 @@ class QLMJob(JobV1):
             qobj_id: Identifier of the initial Qobj structure
             metadata: List of the circuit's metadata
             qobj_header: user input that will be in the Result
+            nbshots: number of shots of the experiments
         """
         self._results = _qlm_to_qiskit_result(
             self._backend._configuration.backend_name,
@@ -284,6 +305,7 @@ class QLMJob(JobV1):
             qlm_result,
             metadata,
             qobj_header,
+            nbshots,
         )
 
     def status(self):
@@ -358,6 +380,72 @@ class NoQpuAttached(Exception):
 
 _QLM_BACKEND = BackendConfiguration.from_dict(_QLM_PARAMS)
 
+# Maximal number of translated circuits kept by QPUToBackend
+_TRANSLATION_CACHE_SIZE = 128
+
+# Cache of the IBM accounts saved on disk, so repeated QPU constructions
+# do not hit the disk again
+_SAVED_ACCOUNTS_CACHE = None
+
+
+def _get_backend(backend=None, token=None, ibm_backend='ibm_brisbane'):
+    """
+    Returns the Qiskit backend that should execute circuits. This is the
+    common implementation of the set_backend methods of BackendToQPU and
+    AsyncBackendToQPU.
+
+    Args:
+        backend: The Backend Qiskit object to be wrapped
+        token: Qiskit ibm login token. If not supplied, loaded from env
+                variable QISKIT_TOKEN. Only used if backend is None
+        ibm_backend: Name of the IBM Quantum Platform backend
+
+    Returns:
+        A Qiskit backend object
+    """
+    global _SAVED_ACCOUNTS_CACHE
+    if backend is not None:
+        return backend
+
+    if token is None:
+        token = os.getenv("QISKIT_TOKEN")
+    if token is None:
+        return Aer.get_backend("aer_simulator")
+
+    if _SAVED_ACCOUNTS_CACHE is None:
+        _SAVED_ACCOUNTS_CACHE = IBMProvider.saved_accounts()
+    if _SAVED_ACCOUNTS_CACHE.get('token') != token:
+        IBMProvider.save_account(token, overwrite=True)
+        _SAVED_ACCOUNTS_CACHE = dict(_SAVED_ACCOUNTS_CACHE, token=token)
+
+    provider = IBMProvider()
+    return provider.get_backend(ibm_backend)
+
+
+def _circuit_key(circuit):
+    """
+    Computes a hashable fingerprint of a Qiskit circuit. Two circuits with
+    the same registers, instructions and bound parameter values share the
+    same key, so their QLM translation can be reused.
+
+    Args:
+        circuit: The Qiskit QuantumCircuit to fingerprint
+
+    Returns:
+        A hashable tuple identifying the circuit
+    """
+    return (
+        tuple((reg.name, reg.size) for reg in circuit.qregs),
+        tuple((reg.name, reg.size) for reg in circuit.cregs),
+        tuple(
+            (gate_op[0].name,
+             tuple((qarg._register.name, qarg._index) for qarg in gate_op[1]),
+             tuple((carg._register.name, carg._index) for carg in gate_op[2]),
+             tuple(str(param) for param in gate_op[0].params))
+            for gate_op in circuit.data
+        ),
+    )
+
 
 class QPUToBackend(BackendV1):
     """
@@ -386,6 +474,7 @@ class QPUToBackend(BackendV1):
         super().__init__(configuration, provider)
         self.id_counter = 0
         self._qpu = qpu
+        self._translation_cache = OrderedDict()
 
     def set_qpu(self, qpu):
         """
@@ -426,7 +515,18 @@ class QPUToBackend(BackendV1):
         qlm_task = Batch(jobs=[])
         circuits_metadata = []
         for circuit in circuits:
-            qlm_circuit = qiskit_to_qlm(circuit)
+            # Reuse a previous translation when only parameter values of an
+            # already seen circuit changed (e.g. variational workloads)
+            key = _circuit_key(circuit)
+            qlm_circuit = self._translation_cache.get(key)
+            if qlm_circuit is None:
+                qlm_circuit = qiskit_to_qlm(circuit)
+                self._translation_cache[key] = qlm_circuit
+                if len(self._translation_cache) > _TRANSLATION_CACHE_SIZE:
+                    self._translation_cache.popitem(last=False)
+            else:
+                self._translation_cache.move_to_end(key)
+                qlm_circuit = copy.deepcopy(qlm_circuit)
             circuits_metadata.append({'n_qubits': qlm_circuit.nbqbits, 'memory_slots': qlm_circuit.nbqbits})
             job = qlm_circuit.to_job(aggregate_data=False)
             job.nbshots = nbshots
@@ -443,7 +543,8 @@ class QPUToBackend(BackendV1):
         # Creating a job that will contain the results
         job = QLMJob(self, str(self.id_counter))
         self.id_counter += 1
-        job.set_results(results, qobj_id, circuits_metadata, qobj_header)
+        job.set_results(results, qobj_id, circuits_metadata, qobj_header,
+                        nbshots)
         return job
 
 
@@ -501,20 +602,7 @@ class BackendToQPU(QPUHandler):
             ibm_backend: Name of the IBM Quantum Platform backend, default
                     value is 'ibm_brisbane', which goes up to 127 qubits
         """
-        if backend is None:
-            if token is None:
-                token = os.getenv("QISKIT_TOKEN")
-            if token is not None:
-                if 'token' not in IBMProvider.saved_accounts().keys() or \
-                        IBMProvider.saved_accounts()['token'] != token:
-                    IBMProvider.save_account(token, overwrite=True)
-
-                provider = IBMProvider()
-                self.backend = provider.get_backend(ibm_backend)
-            else:
-                self.backend = Aer.get_backend("aer_simulator")
-        else:
-            self.backend = backend
+        self.backend = _get_backend(backend, token, ibm_backend)
 
     def _submit_batch(self, qlm_batch):
         """
@@ -736,20 +824,7 @@ class AsyncBackendToQPU(QPUHandler):
             ibm_backend: Name of the IBM Quantum Platform backend, default
                     value is 'ibm_brisbane', which goes up to 127 qubits
         """
-        if backend is None:
-            if token is None:
-                token = os.getenv("QISKIT_TOKEN")
-            if token is not None:
-                if 'token' not in IBMProvider.saved_accounts().keys() or \
-                        IBMProvider.saved_accounts()['token'] != token:
-                    IBMProvider.save_account(token, overwrite=True)
-
-                provider = IBMProvider()
-                self.backend = provider.get_backend(ibm_backend)
-            else:
-                self.backend = Aer.get_backend("aer_simulator")
-        else:
-            self.backend = backend
+        self.backend = _get_backend(backend, token, ibm_backend)
 
     def submit_job(self, qlm_job):
         """
@@ -11,6 +11,7 @@ Description: Testing the Qiskit Runtime QPU. This test file will mock the
              Estimator and Sampler services
 """
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -27,6 +28,9 @@ except ImportError:
 
 from hardware import running_python
 
+# Evaluated once at import: both skipif decorators share the result
+_UNSUPPORTED_PYTHON = running_python("<", "3.8.0")
+
 
 @dataclass
 class FakeQiskitResult:
@@ -129,9 +133,13 @@ class FakeSampler(AbstractPrimitive):
         """
         assert observables is None
 
+        # Results are read-only: one template dict is shared by all the
+        # circuits of the batch
+        distribution = {0b00: 0.5, 0b11: 0.5}
+        metadata = {"shots": self.nbshots}
         return FakeQiskitResult(
-            quasi_dists=[{0b00: 0.5, 0b11: 0.5} for _ in circuits],
-            metadata=[{"shots": self.nbshots} for _ in circuits]
+            quasi_dists=[distribution] * len(circuits),
+            metadata=[metadata] * len(circuits)
         )
 
 
@@ -147,13 +155,51 @@ class FakeEstimator(AbstractPrimitive):
         # Check arguments
         assert len(circuits) == len(observables)
 
-        # Return result
+        # Return result (the metadata template is shared, results are
+        # read-only)
+        metadata = {"variance": 0}
         return FakeQiskitResult(
-            values=[1. for _ in circuits],
-            metadata=[{"variance": 0} for _ in circuits]
+            values=[1.] * len(circuits),
+            metadata=[metadata] * len(circuits)
         )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_runtime(module_mocker):
+    """
+    Patch the Qiskit Runtime primitives once for the whole module,
+    instead of re-installing the patches on every parametrize case
+    """
+    module_mocker.patch("qat.interop.qiskit.runtime.Session", FakeSession)
+    module_mocker.patch("qat.interop.qiskit.runtime.Sampler", FakeSampler)
+    module_mocker.patch("qat.interop.qiskit.runtime.Estimator", FakeEstimator)
+
+
+@pytest.fixture(scope="module")
+def qpu():
+    """
+    QPU under test - stateless under the mocked primitives, so a single
+    instance is shared by the whole module
+    """
+    return QiskitRuntimeQPU(backend="NO BACKEND", service="NO SERVICE")
+
+
+@pytest.fixture
+def jobs(request):
+    """
+    Build the submitted jobs lazily from a (mode, shape) tag. Used with
+    indirect parametrization, so deselected tests never construct their
+    jobs at collection
+    """
+    mode, shape = request.param
+    build = _build_sample_job if mode == "sample" else _build_observable_job
+    if shape == "one":
+        return build()
+    if shape == "list":
+        return [build(), build()]
+    return Batch(jobs=[build(), build()])
+
+
 # ########################################################### #
 # Checking the sampling mode                                  #
 # These tests submit Bell Pairs to a QPU, the expected output #
@@ -161,10 +207,11 @@ class FakeEstimator(AbstractPrimitive):
 # ########################################################### #
 
 
-def _build_sample_job():
+@functools.lru_cache(maxsize=None)
+def _build_sample_circuit():
     """
-    Build a sampling job
-    The circuit is a Bell Pair
+    Build the sampling circuit (a Bell Pair). The circuit is built once
+    and shared by all the sampling jobs
     """
     # Build program
     prog = Program()
@@ -172,9 +219,16 @@ def _build_sample_job():
     prog.apply(H, qbits[0])
     prog.apply(CNOT, qbits)
 
-    # Build job
-    circ = prog.to_circ()
-    return circ.to_job()
+    # Build circuit
+    return prog.to_circ()
+
+
+def _build_sample_job():
+    """
+    Build a sampling job
+    The circuit is a Bell Pair
+    """
+    return _build_sample_circuit().to_job()
 
 
 def _check_one_result(result):
@@ -193,22 +247,18 @@ def _check_one_result(result):
 
 @pytest.mark.parametrize(
     ["jobs", "number_of_jobs"],
-    [pytest.param(_build_sample_job(), 1, id="one job"),
-     pytest.param([_build_sample_job(), _build_sample_job()], 2, id="list of jobs"),
-     pytest.param(Batch(jobs=[_build_sample_job(), _build_sample_job()]), 2, id="one batch")]
+    [pytest.param(("sample", "one"), 1, id="one job"),
+     pytest.param(("sample", "list"), 2, id="list of jobs"),
+     pytest.param(("sample", "batch"), 2, id="one batch")],
+    indirect=["jobs"]
 )
-@pytest.mark.skipif(running_python("<", "3.8.0"), reason="Test not supported")
-def test_sampling_mode(mocker, jobs, number_of_jobs):
+@pytest.mark.skipif(_UNSUPPORTED_PYTHON, reason="Test not supported")
+def test_sampling_mode(qpu, jobs, number_of_jobs):
     """
     Testing IBM QPU in sampling mode
     This test submit a Bell Pair and checks the result
     """
-    # Mock sampler
-    mocker.patch("qat.interop.qiskit.runtime.Session", FakeSession)
-    mocker.patch("qat.interop.qiskit.runtime.Sampler", FakeSampler)
-
     # Submit job
-    qpu = QiskitRuntimeQPU(backend="NO BACKEND", service="NO SERVICE")
     results = qpu.submit(jobs)
 
     # Check result
@@ -228,40 +278,44 @@ def test_sampling_mode(mocker, jobs, number_of_jobs):
 # measure "X" observable and check the average value          #
 # ########################################################### #
 
-def _build_observable_job():
+@functools.lru_cache(maxsize=None)
+def _build_observable_circuit():
     """
-    Build an observable job. The circuit is composed of a single
-    gate "H" and the measure observable is "X"
+    Build the observable-mode circuit (a single "H" gate). The circuit
+    is built once and shared by all the observable jobs
     """
     # Build program
     prog = Program()
     qbit = prog.qalloc(1)
     prog.apply(H, qbit)
 
-    # Build job
-    circ = prog.to_circ()
-    return circ.to_job("OBS", observable=Observable.sigma_x(0, 1))
+    # Build circuit
+    return prog.to_circ()
+
+
+def _build_observable_job():
+    """
+    Build an observable job. The circuit is composed of a single
+    gate "H" and the measure observable is "X"
+    """
+    return _build_observable_circuit().to_job("OBS", observable=Observable.sigma_x(0, 1))
 
 
 @pytest.mark.parametrize(
     ["jobs", "number_of_jobs"],
-    [pytest.param(_build_observable_job(), 1, id="one job"),
-     pytest.param([_build_observable_job(), _build_observable_job()], 2, id="list of jobs"),
-     pytest.param(Batch(jobs=[_build_observable_job(), _build_observable_job()]), 2, id="one batch")]
+    [pytest.param(("observable", "one"), 1, id="one job"),
+     pytest.param(("observable", "list"), 2, id="list of jobs"),
+     pytest.param(("observable", "batch"), 2, id="one batch")],
+    indirect=["jobs"]
 )
-@pytest.mark.skipif(running_python("<", "3.8.0"), reason="Test not supported")
-def test_observable_mode(mocker, jobs, number_of_jobs):
+@pytest.mark.skipif(_UNSUPPORTED_PYTHON, reason="Test not supported")
+def test_observable_mode(qpu, jobs, number_of_jobs):
     """
     Testing IBM QPU in observable mode
     This test submit a circuit composed of an H gate and measure the "X"
     observable
     """
-    # Mock sampler
-    mocker.patch("qat.interop.qiskit.runtime.Session", FakeSession)
-    mocker.patch("qat.interop.qiskit.runtime.Estimator", FakeEstimator)
-
     # Submit job
-    qpu = QiskitRuntimeQPU(backend="NO BACKEND", service="NO SERVICE")
     results = qpu.submit(jobs)
 
     if number_of_jobs == 1: